@@ -1,58 +1,366 @@
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
+import logging
 import os
 import sys
+import tempfile
 import threading
-import queue
 import requests
-import subprocess
-from typing import Dict, Any, Optional
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from itertools import chain, cycle
+from requests.adapters import HTTPAdapter
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple, Union
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+
+    HAVE_ORJSON = True
+except ImportError:  # orjson is an optional speedup; stdlib json also accepts bytes
+    from json import loads as json_loads
+
+    HAVE_ORJSON = False
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; only used to stream-parse when orjson is missing
+    ijson = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read a positive integer setting; malformed or too-small values fall back/clamp with a logged error."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.error("%s must be an integer, got %r; using %d", name, raw, default)
+        return default
+    if value < minimum:
+        logger.error("%s must be at least %d, got %d; using %d", name, minimum, value, minimum)
+        return minimum
+    return value
+
+
+# Upper bound on agents talking to GitHub/Slack at the same time; override with WORKFLOW_MAX_PARALLEL
+# (2-8 is typical). Env settings are read when a coordinator/agent is built, so reset() picks up changes.
+DEFAULT_MAX_PARALLEL = 4
+
+# (connect, read) timeouts applied to every outbound call
+HTTP_TIMEOUT = (3.05, 30)
+
+GITHUB_API_URL = "https://api.github.com/"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}graphql"
+
+# Merged PRs only, with just the fields the release notes need (one request, one rate-limit point per page)
+MERGED_PRS_QUERY = """
+query($o: String!, $n: String!, $after: String) {
+  repository(owner: $o, name: $n) {
+    pullRequests(states: MERGED, first: 100, after: $after, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes { number title mergedAt author { login } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# Identifies the query shape in cache keys, so editing the query invalidates cached results
+_QUERY_DIGEST = hashlib.blake2b(MERGED_PRS_QUERY.encode(), digest_size=8).hexdigest()
+
+# Pages of 100 merged PRs to collect per run; raise GITHUB_MAX_PAGES when a release window spans more
+DEFAULT_MAX_PAGES = 1
+
+
+NOTES_HEADER = "*Release Notes:*\n"
+PR_LINE_TEMPLATE = "- PR #{number}: {title} (by @{login}, merged {merged_at})"
+
+
+def _unknown() -> str:
+    return "unknown"
+
+
+def _format_pr_line(pr: Dict[str, Any]) -> str:
+    # Missing fields render as "unknown" without per-field .get calls or throwaway empty dicts
+    fields = defaultdict(_unknown, pr)
+    fields["login"] = (pr.get("user") or {}).get("login") or "unknown"
+    return PR_LINE_TEMPLATE.format_map(fields)
+
+
+def _user_cache_dir() -> str:
+    # Per-user ($XDG_CACHE_HOME or ~/.cache) rather than a predictable name in the shared temp dir
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "release_notes_workflow")
+
+
+# Stay under Slack's ~40 KB message limit; larger notes are split across several posts
+SLACK_PAYLOAD_LIMIT = 39_000
+_EMPTY_PAYLOAD_SIZE = len(json_dumps({"text": ""}))
+SLACK_HEADERS = {"Content-Type": "application/json"}
+
+# Digest of the last message delivered, so unchanged notes are not re-posted on every poll (SLACK_HASH_FILE)
+DEFAULT_SLACK_HASH_PATH = os.path.join(_user_cache_dir(), "slack_hash")
+
+# Conditional-request cache for merged PRs, persisted so cron-style runs can reuse it (GITHUB_ETAG_CACHE)
+DEFAULT_ETAG_CACHE_PATH = os.path.join(_user_cache_dir(), "etag_cache.json")
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    """Create a pooled session so GitHub/Slack calls reuse TCP+TLS connections."""
+    session = requests.Session()
+    # GitHub calls (REST probe GET, GraphQL query POST) are idempotent reads: retry transient failures on the
+    # pooled connection, honouring Retry-After. The last response is returned rather than raised so callers
+    # report its status and body.
+    github_adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    # Everything else is the Slack webhook, a non-idempotent POST: only retry when the message was certainly
+    # not accepted, i.e. connect errors (the request never left) and 429 responses. Read errors (read=False)
+    # and any other mid-request failure such as an SSLError while reading the response (other=0) are raised,
+    # as are 5xx responses: each may follow a delivered message, so re-posting could duplicate it.
+    webhook_adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=5,
+            read=False,
+            other=0,
+            backoff_factor=0.5,
+            status_forcelist=(429,),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    # requests picks the longest matching prefix, so GitHub traffic never falls through to the webhook policy
+    session.mount(GITHUB_API_URL, github_adapter)
+    session.mount("https://", webhook_adapter)
+    return session
+
+
+# Shared by all agents; pool size matches the coordinator's concurrency bound
+_SESSION = _build_session(DEFAULT_MAX_PARALLEL)
 
 
 class EnvironmentError(Exception):
     pass
 
 
-def validate_env_vars_and_secrets(env_vars, secrets):
-    missing = []
-    for var in env_vars + secrets:
-        if not os.getenv(var):
-            missing.append(var)
+@functools.lru_cache(maxsize=None)
+def _ensure_env(keys: Tuple[str, ...]) -> None:
+    # Only successful checks are cached (a raise is never memoized), so a fixed env is re-checked next time
+    environ = os.environ
+    missing = [var for var in keys if not environ.get(var)]
     if missing:
         raise EnvironmentError(f"Missing required environment variables or secrets: {', '.join(missing)}")
 
 
+def validate_env_vars_and_secrets(env_vars, secrets):
+    _ensure_env(tuple(chain(env_vars, secrets)))
+
+
+def _read_json(response: requests.Response) -> Dict[str, Any]:
+    """Parse a JSON object body: orjson on the raw bytes, else stream it with ijson, else stdlib json."""
+    # A GraphQL page is capped at 100 nodes (~11 KB), where orjson on the buffered bytes is ~4x faster
+    # than streaming and the memory saved by streaming is negligible
+    if HAVE_ORJSON or ijson is None:
+        return json_loads(response.content)
+    # Without orjson, build the top-level items straight from the decoded stream instead of a str copy
+    response.raw.decode_content = True
+    return dict(ijson.kvitems(response.raw, ""))
+
+
+@contextlib.asynccontextmanager
+async def _holding(lock: threading.Lock) -> AsyncIterator[None]:
+    """
+    Hold a thread lock from a coroutine.
+
+    Agents are shared by runs on different threads and event loops, so an asyncio.Lock would not do. Polling
+    keeps this loop responsive while another run holds the lock, and a cancelled waiter never owns it.
+    """
+    while not lock.acquire(blocking=False):
+        await asyncio.sleep(0.01)
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def _load_etag_cache(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            cache = json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    # Anything but an object (e.g. a truncated or hand-edited file holding "[]") is treated as empty
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_etag_cache(path: str, cache: Dict[str, Dict[str, Any]]) -> None:
+    directory = os.path.dirname(path) or "."
+    tmp_path = None
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # A unique temp file per write, so concurrent writers (threads included) never share one
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".etag_cache.", suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is an optimization only; a failed write just means a full fetch next time
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+@dataclass(slots=True)
+class FetchResult:
+    """Merged PR records produced by FetchPRDataAgent."""
+
+    prs: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class FormatResult:
+    """Encoded Slack webhook bodies produced by GenerateReleaseNotesAgent."""
+
+    payloads: List[bytes]
+
+
+@dataclass(slots=True)
+class SendResult:
+    """Whether SendToSlackAgent delivered the notes or skipped them as empty/unchanged."""
+
+    sent: bool
+
+
 class FetchPRDataAgent:
     """Retrieve pull request data from GitHub."""
 
     REQUIRED_SECRETS = ["GITHUB_TOKEN"]
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         validate_env_vars_and_secrets([], self.REQUIRED_SECRETS)
         self.github_token = os.getenv("GITHUB_TOKEN")
-
-    def fetch_prs(self) -> str:
-        # TODO: Adjust repo and filtering criteria as needed
-        repo = os.getenv("GITHUB_REPOSITORY", "owner/repo")  # e.g. "owner/repo"
-        url = f"https://api.github.com/repos/{repo}/pulls"
+        # Optional comma-separated pool; requests rotate through it to spread rate-limit usage
+        tokens = [token.strip() for token in os.getenv("GITHUB_TOKENS", "").split(",") if token.strip()]
+        self._tokens = cycle(tokens or [self.github_token])
+        self.session = session or _SESSION
+        self.max_pages = _env_int("GITHUB_MAX_PAGES", DEFAULT_MAX_PAGES)
+        self.cache_path = os.getenv("GITHUB_ETAG_CACHE", DEFAULT_ETAG_CACHE_PATH)
+        # cache key (repo, page count, query shape) -> {"etag": ..., "prs": [...]}
+        self._etag_cache = _load_etag_cache(self.cache_path)
+        # Guards probe -> query -> cache update/save; overlapping runs then reuse the stored ETag
+        self._fetch_lock = threading.Lock()
+
+    def _cache_key(self, repo: str) -> str:
+        # A different page budget or query returns a different list, so neither may reuse the other's entry
+        return f"{repo}|pages={self.max_pages}|query={_QUERY_DIGEST}"
+
+    async def _probe_etag(self, repo: str) -> Optional[str]:
+        """
+        Probe the REST pulls listing with If-None-Match.
+
+        GraphQL does not support conditional requests, but the most recently updated closed PR changes
+        whenever a PR is merged, so a 304 here (free of rate-limit cost) means the cached list is current.
+        Returns None when the cache can be used, otherwise the new ETag to store.
+        """
+        url = f"{GITHUB_API_URL}repos/{repo}/pulls"
+        # Always the primary token: GitHub varies ETags by Authorization, so rotating would defeat the 304
         headers = {"Authorization": f"token {self.github_token}", "Accept": "application/vnd.github.v3+json"}
-        params = {"state": "closed", "per_page": 100}
-
-        response = requests.get(url, headers=headers, params=params)
+        params = {"state": "closed", "sort": "updated", "direction": "desc", "per_page": 1}
+        cached = self._etag_cache.get(self._cache_key(repo))
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+
+        response = await asyncio.to_thread(
+            self.session.get, url, headers=headers, params=params, timeout=HTTP_TIMEOUT
+        )
+        if response.status_code == 304 and cached:
+            return None
         if response.status_code != 200:
             raise RuntimeError(f"GitHub API request failed with status {response.status_code}: {response.text}")
-
-        prs = response.json()
-
-        # Filter PRs merged recently (e.g., last release) - here we just take all closed merged PRs
-        merged_prs = [pr for pr in prs if pr.get("merged_at")]
-
-        # Compose raw release notes data as JSON string
-        import json
-        raw_data = json.dumps(merged_prs)
-        return raw_data
-
-    def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        release_notes_raw = self.fetch_prs()
-        return {"release_notes": release_notes_raw}
+        return response.headers.get("ETag", "")
+
+    async def _query_page(self, owner: str, name: str, cursor: Optional[str]) -> Dict[str, Any]:
+        headers = {"Authorization": f"bearer {next(self._tokens)}"}
+        payload = {"query": MERGED_PRS_QUERY, "variables": {"o": owner, "n": name, "after": cursor}}
+
+        def _query() -> Dict[str, Any]:
+            with self.session.post(
+                GITHUB_GRAPHQL_URL, headers=headers, json=payload, timeout=HTTP_TIMEOUT, stream=True
+            ) as response:
+                if response.status_code != 200:
+                    raise RuntimeError(
+                        f"GitHub API request failed with status {response.status_code}: {response.text}"
+                    )
+                return _read_json(response)
+
+        # requests is blocking, so hand the round-trip (and the streamed parse) to a worker thread
+        body = await asyncio.to_thread(_query)
+        if body.get("errors"):
+            raise RuntimeError(f"GitHub GraphQL query failed: {body['errors']}")
+        return body["data"]["repository"]["pullRequests"]
+
+    async def fetch_prs(self) -> List[Dict[str, Any]]:
+        # TODO: Adjust repo and filtering criteria as needed
+        repo = os.getenv("GITHUB_REPOSITORY", "owner/repo")  # e.g. "owner/repo"
+        async with _holding(self._fetch_lock):
+            etag = await self._probe_etag(repo)
+            if etag is None:
+                return self._etag_cache[self._cache_key(repo)]["prs"]
+
+            owner, name = repo.split("/", 1)
+            merged_prs = []
+            cursor = None
+            # GraphQL pages are cursor-linked, so they are walked in order rather than fetched concurrently
+            for _ in range(self.max_pages):
+                pull_requests = await self._query_page(owner, name, cursor)
+                # The query only returns merged PRs, so reshape the nodes into the REST-style records
+                # GenerateReleaseNotesAgent expects instead of filtering client-side.
+                merged_prs.extend(
+                    {
+                        "number": node["number"],
+                        "title": node["title"],
+                        "user": {"login": (node.get("author") or {}).get("login")},
+                        "merged_at": node["mergedAt"],
+                    }
+                    for node in pull_requests["nodes"]
+                )
+                page_info = pull_requests["pageInfo"]
+                if not page_info["hasNextPage"]:
+                    break
+                cursor = page_info["endCursor"]
+
+            if etag:
+                self._etag_cache[self._cache_key(repo)] = {"etag": etag, "prs": merged_prs}
+                _save_etag_cache(self.cache_path, self._etag_cache)
+            return merged_prs
+
+    async def run(self, task_context: Optional[Dict[str, Any]] = None) -> FetchResult:
+        # Hand the parsed records straight to the next agent; no JSON round-trip in between
+        return FetchResult(await self.fetch_prs())
 
 
 class GenerateReleaseNotesAgent:
@@ -62,31 +370,45 @@ class GenerateReleaseNotesAgent:
         # No env vars or secrets required
         pass
 
-    def format_notes(self, raw_pr_data: str) -> str:
-        import json
-        try:
-            prs = json.loads(raw_pr_data)
-        except Exception as e:
-            raise RuntimeError(f"Failed to parse PR data JSON: {e}")
-
-        # Format release notes in a user-friendly manner
-        notes_lines = ["*Release Notes:*\n"]
-        for pr in prs:
-            number = pr.get("number")
-            title = pr.get("title")
-            user = pr.get("user", {}).get("login")
-            merged_at = pr.get("merged_at")
-            notes_lines.append(f"- PR #{number}: {title} (by @{user}, merged {merged_at})")
-
-        formatted_notes = "\n".join(notes_lines)
-        return formatted_notes
-
-    def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        raw_notes = inputs.get("release_notes")
-        if raw_notes is None:
-            raise ValueError("Input 'release_notes' is required for GenerateReleaseNotesAgent")
-        formatted = self.format_notes(raw_notes)
-        return {"release_notes": formatted}
+    def format_notes(self, raw_pr_data: Union[List[Dict[str, Any]], str, bytes]) -> str:
+        if isinstance(raw_pr_data, (str, bytes)):
+            try:
+                prs = json_loads(raw_pr_data)
+            except Exception as e:
+                raise RuntimeError(f"Failed to parse PR data JSON: {e}")
+        else:
+            prs = raw_pr_data
+
+        # Format release notes in a user-friendly manner, joined in a single pass
+        return "\n".join(chain((NOTES_HEADER,), map(_format_pr_line, prs)))
+
+    def format_payloads(self, raw_pr_data: Union[List[Dict[str, Any]], str, bytes]) -> List[bytes]:
+        """Encode the notes as ready-to-post Slack webhook bodies, chunked on line boundaries."""
+        notes = self.format_notes(raw_pr_data)
+        payload = json_dumps({"text": notes})
+        if len(payload) <= SLACK_PAYLOAD_LIMIT:
+            return [payload]
+
+        payloads = []
+        chunk: List[str] = []
+        size = _EMPTY_PAYLOAD_SIZE
+        for line in notes.split("\n"):
+            # Escaped length plus quotes == escaped length plus the "\n" separator it needs
+            line_size = len(json_dumps(line))
+            if chunk and size + line_size > SLACK_PAYLOAD_LIMIT:
+                payloads.append(json_dumps({"text": "\n".join(chunk)}))
+                chunk = []
+                size = _EMPTY_PAYLOAD_SIZE
+            chunk.append(line)
+            size += line_size
+        payloads.append(json_dumps({"text": "\n".join(chunk)}))
+        return payloads
+
+    async def run(self, fetched: FetchResult) -> FormatResult:
+        if not fetched.prs:
+            # Nothing merged: no message to send
+            return FormatResult([])
+        return FormatResult(self.format_payloads(fetched.prs))
 
 
 class SendToSlackAgent:
@@ -94,22 +416,59 @@ class SendToSlackAgent:
 
     REQUIRED_SECRETS = ["SLACK_WEBHOOK_URL"]
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         validate_env_vars_and_secrets([], self.REQUIRED_SECRETS)
         self.webhook_url = os.getenv("SLACK_WEBHOOK_URL")
+        self.session = session or _SESSION
+        self.hash_path = os.getenv("SLACK_HASH_FILE", DEFAULT_SLACK_HASH_PATH)
+        self._last_hash = self._load_last_hash()
+        # Guards check -> post -> store, so overlapping runs cannot both post the same notes
+        self._send_lock = threading.Lock()
 
-    def post_to_slack(self, message: str) -> None:
-        payload = {"text": message}
-        response = requests.post(self.webhook_url, json=payload)
+    def _load_last_hash(self) -> Optional[str]:
+        try:
+            with open(self.hash_path) as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _store_last_hash(self, digest: str) -> None:
+        self._last_hash = digest
+        try:
+            os.makedirs(os.path.dirname(self.hash_path) or ".", mode=0o700, exist_ok=True)
+            with open(self.hash_path, "w") as f:
+                f.write(digest)
+        except OSError:
+            # Losing the digest only means the same notes may be posted once more
+            pass
+
+    async def post_to_slack(self, payload: bytes) -> None:
+        response = await asyncio.to_thread(
+            self.session.post, self.webhook_url, data=payload, headers=SLACK_HEADERS, timeout=HTTP_TIMEOUT
+        )
         if response.status_code != 200:
             raise RuntimeError(f"Slack webhook failed with status {response.status_code}: {response.text}")
 
-    def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        message = inputs.get("release_notes")
-        if message is None:
-            raise ValueError("Input 'release_notes' is required for SendToSlackAgent")
-        self.post_to_slack(message)
-        return {}
+    async def run(self, formatted: FormatResult) -> SendResult:
+        payloads = formatted.payloads
+        # Keyed by destination too, so the same notes bound for a different webhook are still delivered
+        digest = hashlib.blake2b(self.webhook_url.encode(), digest_size=16)
+        for payload in payloads:
+            digest.update(payload)
+        message_hash = digest.hexdigest()
+        if not payloads:
+            return SendResult(sent=False)
+
+        async with _holding(self._send_lock):
+            if message_hash == self._last_hash:
+                # Identical to the last delivery: skip the network round-trip entirely
+                return SendResult(sent=False)
+
+            # Post chunks in order on the same pooled connection
+            for payload in payloads:
+                await self.post_to_slack(payload)
+            self._store_last_hash(message_hash)
+        return SendResult(sent=True)
 
 
 class FinalValidationAgent:
@@ -119,24 +478,35 @@ class FinalValidationAgent:
         # No env vars or secrets required
         pass
 
-    def validate_slack_message(self) -> None:
+    def validate_slack_message(self, result: SendResult) -> None:
         # TODO: Implement actual validation if possible
-        # For now, just log success
-        print("Final validation: Release notes sent to Slack successfully.")
+        # For now, just log the outcome
+        if result.sent:
+            logger.info("Final validation: Release notes sent to Slack successfully.")
+        else:
+            logger.info("Final validation: Release notes empty or unchanged; Slack post skipped.")
 
-    def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        self.validate_slack_message()
-        return {}
+    async def run(self, result: SendResult) -> None:
+        self.validate_slack_message(result)
 
 
 class WorkflowCoordinator:
     """Coordinates execution of agents respecting dependencies."""
 
-    def __init__(self):
+    def __init__(self, max_parallel: Optional[int] = None):
+        if max_parallel is None:
+            max_parallel = _env_int("WORKFLOW_MAX_PARALLEL", DEFAULT_MAX_PARALLEL)
+        if max_parallel < 1:
+            # Semaphore(0) would block every agent forever
+            raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+        self.max_parallel = max_parallel
+        # Keep the connection pool as wide as the concurrency bound
+        session = _SESSION if max_parallel == DEFAULT_MAX_PARALLEL else _build_session(max_parallel)
+
         self.agents = {
-            "fetch_pr_data": FetchPRDataAgent(),
+            "fetch_pr_data": FetchPRDataAgent(session),
             "generate_release_notes": GenerateReleaseNotesAgent(),
-            "send_to_slack": SendToSlackAgent(),
+            "send_to_slack": SendToSlackAgent(session),
             "final_validation": FinalValidationAgent(),
         }
 
@@ -148,56 +518,98 @@ class WorkflowCoordinator:
             "final_validation": ["send_to_slack"],
         }
 
-        # Store outputs keyed by agent name
-        self.outputs: Dict[str, Dict[str, Any]] = {}
-
-    def run_workflow(self, task_context: Optional[Dict[str, Any]] = None) -> None:
+        # Precompute the DAG shape once: children per node, in-degrees, and a topological order (Kahn)
+        self._children: Dict[str, List[str]] = defaultdict(list)
+        for agent_name, deps in self.dependencies.items():
+            for dep in deps:
+                self._children[dep].append(agent_name)
+        self._in_deg = {agent_name: len(deps) for agent_name, deps in self.dependencies.items()}
+        self.execution_order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        in_deg = dict(self._in_deg)
+        ready = deque(agent_name for agent_name, deg in in_deg.items() if deg == 0)
+        order = []
+        while ready:
+            agent_name = ready.popleft()
+            order.append(agent_name)
+            for child in self._children[agent_name]:
+                in_deg[child] -= 1
+                if in_deg[child] == 0:
+                    ready.append(child)
+        if len(order) != len(self.dependencies):
+            raise ValueError("Workflow dependencies contain a cycle")
+        return order
+
+    async def run_workflow(self, task_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run the DAG once and return the result records keyed by agent name."""
         if task_context is None:
             task_context = {}
 
-        # Execution order is linear here, but we implement a DAG executor for extensibility
-        executed = set()
-        to_execute = set(self.agents.keys())
-
-        # Use a simple queue to manage ready agents
-        ready_queue = queue.Queue()
-
-        # Initialize ready queue with agents with no dependencies
-        for agent_name, deps in self.dependencies.items():
-            if not deps:
-                ready_queue.put(agent_name)
+        # Per-run state stays local: the coordinator is shared by concurrent runs (possibly on different
+        # event loops), and asyncio primitives bind to the loop they are first used on. Agents that keep
+        # state across runs (ETag cache, last Slack digest) guard it with their own thread locks.
+        # The semaphore gates external calls so fan-out doesn't trip GitHub secondary rate limits or Slack throttling.
+        outputs: Dict[str, Any] = {}
+        sem = asyncio.Semaphore(self.max_parallel)
 
-        while not ready_queue.empty():
-            agent_name = ready_queue.get()
+        async def _run_node(agent_name: str) -> None:
             agent = self.agents[agent_name]
 
-            # Prepare inputs by gathering outputs from dependencies
-            inputs = {}
-            for dep in self.dependencies[agent_name]:
-                dep_outputs = self.outputs.get(dep, {})
-                inputs.update(dep_outputs)
-
-            # Merge with task_context for initial inputs
-            if agent_name == "fetch_pr_data":
-                # fetch_pr_data has no inputs, but can receive context
-                inputs.update(task_context)
+            # Dependency results are passed by reference, positionally in dependency order;
+            # root nodes receive the task context instead
+            args = [outputs[dep] for dep in self.dependencies[agent_name]] or [task_context]
 
             try:
-                output = agent.run(inputs)
-            except EnvironmentError as e:
-                print(f"Environment validation error in {agent_name}: {e}", file=sys.stderr)
-                sys.exit(1)
+                async with sem:
+                    output = await agent.run(*args)
             except Exception as e:
-                print(f"Error running agent {agent_name}: {e}", file=sys.stderr)
-                sys.exit(1)
-
-            self.outputs[agent_name] = output
-            executed.add(agent_name)
+                # Name the failing agent only; the traceback is logged once, by whoever handles the error
+                logger.error("Agent %s failed: %s", agent_name, e)
+                raise
+
+            outputs[agent_name] = output
+
+        # Launch every node whose in-degree hits zero; independent branches run concurrently
+        in_deg = dict(self._in_deg)
+        ready = deque(agent_name for agent_name in self.execution_order if in_deg[agent_name] == 0)
+        running: Dict[asyncio.Task, str] = {}
+        while ready or running:
+            while ready:
+                agent_name = ready.popleft()
+                running[asyncio.create_task(_run_node(agent_name))] = agent_name
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                agent_name = running.pop(task)
+                if task.exception() is not None:
+                    # Cancel in-flight siblings cleanly (the process and its connection pool stay up)
+                    for sibling in running:
+                        sibling.cancel()
+                    await asyncio.gather(*running, return_exceptions=True)
+                    raise task.exception()
+                for child in self._children[agent_name]:
+                    in_deg[child] -= 1
+                    if in_deg[child] == 0:
+                        ready.append(child)
+        return outputs
+
+
+@functools.lru_cache(maxsize=1)
+def _coordinator() -> WorkflowCoordinator:
+    # Built once per process: env validation, sessions and pooled connections are reused across events
+    return WorkflowCoordinator()
+
+
+def reset() -> None:
+    """
+    Drop the cached coordinator and env checks so the next run re-reads the environment.
 
-            # Enqueue agents that depend on this one if all their dependencies are met
-            for next_agent, deps in self.dependencies.items():
-                if next_agent not in executed and all(d in executed for d in deps):
-                    ready_queue.put(next_agent)
+    Hosts that reload configuration on a signal can wire it up themselves, e.g.
+    ``signal.signal(signal.SIGHUP, lambda *_: reset())``.
+    """
+    _coordinator.cache_clear()
+    _ensure_env.cache_clear()
 
 
 # Entrypoint
@@ -214,11 +626,17 @@ def run_workflow(task_context: Dict[str, Any]) -> None:
         RuntimeError: If any agent fails during execution.
 
     Usage:
-        Set environment variables GITHUB_TOKEN, SLACK_WEBHOOK_URL, and optionally GITHUB_REPOSITORY.
-        Then call run_workflow({}) to execute the workflow.
+        Set environment variables GITHUB_TOKEN, SLACK_WEBHOOK_URL, and optionally GITHUB_REPOSITORY,
+        WORKFLOW_MAX_PARALLEL (max concurrently running agents, default 4), GITHUB_ETAG_CACHE
+        (path of the on-disk merged-PR cache), GITHUB_MAX_PAGES (pages of 100 merged PRs, default 1),
+        GITHUB_TOKENS (comma-separated tokens to rotate through) and SLACK_HASH_FILE (where the digest of
+        the last posted message is kept; unchanged notes are not re-posted).
+        Then call run_workflow({}) to execute the workflow. The coordinator is built once per process
+        and is safe to share between concurrent runs (the fetch and Slack agents serialize their cache and
+        dedupe updates); call reset() after changing any of the variables
+        above so the next call rebuilds it with the new settings.
     """
-    coordinator = WorkflowCoordinator()
-    coordinator.run_workflow(task_context)
+    asyncio.run(_coordinator().run_workflow(task_context))
 
 
 # Guidance:
@@ -228,9 +646,10 @@ def run_workflow(task_context: Dict[str, Any]) -> None:
 
 if __name__ == "__main__":
     # Example execution
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
     try:
         run_workflow({})
-        print("Workflow completed successfully.")
-    except Exception as e:
-        print(f"Workflow failed: {e}", file=sys.stderr)
+        logger.info("Workflow completed successfully.")
+    except Exception:
+        logger.exception("Workflow failed")
         sys.exit(1)
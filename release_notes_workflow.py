@@ -8,6 +8,9 @@ import re
 # from github import Github
 # from slack_sdk import WebClient
 
+_RELEASE_NOTES_RE = re.compile(r"release notes:\n(.+)", re.IGNORECASE | re.DOTALL)
+_BULLET_RE = re.compile(r"^-", re.MULTILINE)
+
 
 class InitializeGitHubListener:
     """Set up a listener for GitHub PRs to capture release notes."""
@@ -33,7 +36,7 @@ class ProcessPRReleaseNotes:
 
     def extract_release_notes(self, pr_data: Dict[str, Any]) -> str:
         body = pr_data.get("body", "")
-        match = re.search(r"release notes:\n(.+)", body, re.IGNORECASE | re.DOTALL)
+        match = _RELEASE_NOTES_RE.search(body)
         if not match:
             logging.warning("No release notes found in PR body.")
             return ""
@@ -46,7 +49,7 @@ class FormatReleaseNotes:
     """Convert raw release notes into a Slack-friendly message."""
 
     def format_for_slack(self, release_notes: str, pr_number: int) -> str:
-        formatted = re.sub(r"^-", "*", release_notes, flags=re.MULTILINE)
+        formatted = _BULLET_RE.sub("*", release_notes)
         message = f"*Release Notes for PR #{pr_number}:*\n{formatted}"
         logging.info("Formatted release notes for Slack: %s", message)
         return message